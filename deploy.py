@@ -1,6 +1,8 @@
+import hashlib
+import json
 import subprocess
 import sys
-import os
+from pathlib import Path
 
 def run_mpremote(args):
     """Run mpremote with the given arguments using uv."""
@@ -14,41 +16,94 @@ def run_mpremote(args):
         print(f"Error: Command failed with exit code {e.returncode}")
         sys.exit(e.returncode)
 
-def main():
-    commands = []
-    
-    # 1. Copy lib folder to /lib
-    if os.path.exists("lib"):
-        print("Queueing lib directory copy...")
-        # 'fs cp -r lib :' copies the local 'lib' directory to remote ':' (root)
-        commands.append(["fs", "cp", "-r", "lib", ":"])
-
-    # 2. Copy src contents to root
-    if os.path.exists("src"):
-        print("Queueing src files copy...")
-        for root, dirs, files in os.walk("src"):
-            for file in files:
-                local_path = os.path.join(root, file)
-                # Calculate relative path from src to put at root
-                rel_path = os.path.relpath(local_path, "src")
-                # Ensure forward slashes for remote path
-                remote_path = ":" + rel_path.replace(os.sep, "/")
-                
-                commands.append(["fs", "cp", local_path, remote_path])
+CACHE_FILE = Path(".deploy_cache.json")
 
-    # 3. Reset and enter REPL
-    commands.append(["reset"])
-    commands.append(["repl"])
 
-    # Flatten arguments with "+" separator
+def join_commands(commands):
+    """Flatten mpremote commands into one argument list with "+" separators."""
     final_args = []
     for i, cmd in enumerate(commands):
         final_args.extend(cmd)
         if i < len(commands) - 1:
             final_args.append("+")
+    return final_args
+
+
+def file_hash(path):
+    """Return the md5 hex digest of a local file."""
+    return hashlib.md5(path.read_bytes()).hexdigest()
+
 
+def load_cache():
+    """Load the relpath -> hash map written by the previous deployment."""
+    if "--force" in sys.argv or not CACHE_FILE.exists():
+        return {}
+    try:
+        return json.loads(CACHE_FILE.read_text())
+    except ValueError:
+        return {}
+
+
+def main():
+    commands = []
+    cache = load_cache()
+    hashes = {}
+
+    def changed(path):
+        key = path.as_posix()
+        hashes[key] = file_hash(path)
+        return cache.get(key) != hashes[key]
+
+    def changed_by_dir(root):
+        """Group the changed files under root by their local directory."""
+        by_dir = {}
+        for path in root.rglob("*"):
+            if path.is_file() and changed(path):
+                by_dir.setdefault(path.parent, []).append(path)
+        return by_dir
+
+    def queue_copies(by_dir, remote_of):
+        for directory, paths in by_dir.items():
+            # One 'fs cp' per directory: all its files go to the matching remote directory
+            commands.append(["fs", "cp"] + [str(path) for path in paths] + [remote_of(directory)])
+
+    # 1. Copy changed lib files to /lib
+    lib = Path("lib")
+    if lib.exists():
+        by_dir = changed_by_dir(lib)
+        known_dirs = {Path(key).parent for key in cache}
+        if any(directory not in known_dirs for directory in by_dir):
+            # A directory the board may not have yet: let 'cp -r' create the tree
+            print("Queueing lib directory copy...")
+            commands.append(["fs", "cp", "-r", "lib", ":"])
+        elif by_dir:
+            print("Queueing lib files copy...")
+            queue_copies(by_dir, lambda directory: ":" + directory.as_posix() + "/")
+
+    # 2. Copy changed src files to root
+    src = Path("src")
+    if src.exists():
+        by_dir = changed_by_dir(src)
+        if by_dir:
+            print("Queueing src files copy...")
+
+            def remote_of(directory):
+                rel_dir = directory.relative_to(src).as_posix()
+                return ":" if rel_dir == "." else ":" + rel_dir + "/"
+
+            queue_copies(by_dir, remote_of)
+
+    if commands:
+        print("Copying changed files...")
+        run_mpremote(join_commands(commands))
+        # Saved as soon as the copy succeeds, so an interrupted REPL session keeps it
+        CACHE_FILE.write_text(json.dumps(hashes, indent=2))
+    else:
+        print("No changes since last deployment (use --force to copy everything)")
+
+    # 3. Reset and enter REPL
     print("Executing deployment...")
-    run_mpremote(final_args)
+    run_mpremote(join_commands([["reset"], ["repl"]]))
 
 if __name__ == "__main__":
     main()
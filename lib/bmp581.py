@@ -11,17 +11,77 @@ Based on
 * micropython-bmp581/bmp581py. Author(s): Jose D. Montoya
 
 """
-from typing import Union
+from typing import Tuple, Union
+import math
 import utime as time
 
+import micropython
 from micropython import const
 
 
 WORLD_AVERAGE_SEA_LEVEL_PRESSURE = 1013.25  # International average standard
 
+# International barometric formula coefficients
+_ALTITUDE_SCALE = 44330.77
+_ALTITUDE_EXPONENT = 0.1902632
+
+# Power Modes for BMP581
+_STANDBY = const(0x00)
+_NORMAL = const(0x01)
+_FORCED = const(0x02)
+_NON_STOP = const(0x03)
+
+# Oversample Rate
+_OSR1 = const(0x00)
+_OSR2 = const(0x01)
+_OSR4 = const(0x02)
+_OSR8 = const(0x03)
+_OSR16 = const(0x04)
+_OSR32 = const(0x05)
+_OSR64 = const(0x06)
+_OSR128 = const(0x07)
+
+# IIR Filters Coefficients
+_COEF_0 = const(0x00)
+_COEF_1 = const(0x01)
+_COEF_3 = const(0x02)
+_COEF_7 = const(0x03)
+_COEF_15 = const(0x04)
+_COEF_31 = const(0x05)
+_COEF_63 = const(0x06)
+_COEF_127 = const(0x07)
+
+_I2C_ADDRESS_DEFAULT = const(0x47)
+_I2C_ADDRESS_SECONDARY = const(0x46)
+
+# bmp581 Address & Settings
+_REG_WHOAMI = const(0x01)
+_CHIP_ID = const(0x50)
+_TEMP_DATA_XLSB = const(0x1D)  # temperature 0x1D..0x1F, pressure 0x20..0x22
+_INT_STATUS = const(0x27)
+_DSP_CONFIG = const(0x30)
+_DSP_IIR = const(0x31)
+_OSR_CONF = const(0x36)
+_ODR_CONFIG = const(0x37)
+_CMD_BMP581 = const(0x7E)
+_SOFTRESET = const(0xB6)  # same value for 585,581,390,280
+
+# Setting names returned by the getters, indexed by register value
+_POWER_MODE_NAMES = ("STANDBY", "NORMAL", "FORCED", "NON_STOP")
+_OSR_NAMES = ("OSR1", "OSR2", "OSR4", "OSR8", "OSR16", "OSR32", "OSR64", "OSR128")
+_COEF_NAMES = ("COEF_0", "COEF_1", "COEF_3", "COEF_7", "COEF_15", "COEF_31", "COEF_63", "COEF_127")
+
 import struct
 
 
+@micropython.viper
+def _decode24(val: int) -> int:
+    """Sign-extend a 24-bit two's complement register value"""
+    if val & 0x800000:
+        val -= 0x1000000
+    return val
+
+
 class CBits:
     """
     Changes bits from a byte register
@@ -34,43 +94,45 @@ class CBits:
         start_bit: int,
         register_width=1,
         lsb_first=True,
+        cached=False,
     ) -> None:
         self.bit_mask = ((1 << num_bits) - 1) << start_bit
         self.register = register_address
         self.start_bit = start_bit
         self.length = register_width
+        if lsb_first:
+            # The field lives in the low bytes, which come first on the bus:
+            # transfer only the bytes it spans
+            self.length = min(register_width, (start_bit + num_bits + 7) // 8)
         self.lsb_first = lsb_first
+        self._byteorder = "little" if lsb_first else "big"
+        # read, cache and write all cover the same self.length bytes
+        self._buffer = bytearray(self.length)
+        # cached registers are shadowed in obj._register_cache, so reads and
+        # read-modify-writes skip the bus once the register value is known
+        self.cached = cached
+
+    def _read(self, obj) -> int:
+        if self.cached:
+            reg = obj._register_cache.get(self.register)
+            if reg is not None:
+                return reg
+
+        obj._i2c.readfrom_mem_into(obj._address, self.register, self._buffer)
+        reg = int.from_bytes(self._buffer, self._byteorder)
+
+        if self.cached:
+            obj._register_cache[self.register] = reg
+        return reg
 
     def __get__(self, obj, objtype=None) -> int:
-        mem_value = obj._i2c.readfrom_mem(obj._address, self.register, self.length)
-
-        reg = 0
-        order = range(len(mem_value) - 1, -1, -1)
-        if not self.lsb_first:
-            order = reversed(order)
-        for i in order:
-            reg = (reg << 8) | mem_value[i]
-
-        reg = (reg & self.bit_mask) >> self.start_bit
-
-        return reg
+        return (self._read(obj) & self.bit_mask) >> self.start_bit
 
     def __set__(self, obj, value: int) -> None:
-        memory_value = obj._i2c.readfrom_mem(obj._address, self.register, self.length)
-
-        reg = 0
-        order = range(len(memory_value) - 1, -1, -1)
-        if not self.lsb_first:
-            order = range(0, len(memory_value))
-        for i in order:
-            reg = (reg << 8) | memory_value[i]
-        reg &= ~self.bit_mask
-
-        value <<= self.start_bit
-        reg |= value
-        reg = reg.to_bytes(self.length, "big")
-
-        obj._i2c.writeto_mem(obj._address, self.register, reg)
+        reg = (self._read(obj) & ~self.bit_mask) | ((value << self.start_bit) & self.bit_mask)
+        obj._i2c.writeto_mem(obj._address, self.register, reg.to_bytes(self.length, self._byteorder))
+        if self.cached:
+            obj._register_cache[self.register] = reg
 
 
 class RegisterStruct:
@@ -82,17 +144,26 @@ class RegisterStruct:
         self.format = form
         self.register = register_address
         self.length = struct.calcsize(form)
+        self._buffer = bytearray(self.length)
+        # Precompiled format where struct.Struct exists (not on MicroPython)
+        self._struct = struct.Struct(form) if hasattr(struct, "Struct") else None
 
     def __get__(self, obj, objtype=None):
-        data = obj._i2c.readfrom_mem(obj._address, self.register, self.length)
-        if self.length <= 2:
-            value = struct.unpack(self.format, memoryview(data))[0]
+        data = self._buffer
+        obj._i2c.readfrom_mem_into(obj._address, self.register, data)
+        if self._struct is None:
+            value = struct.unpack(self.format, data)
         else:
-            value = struct.unpack(self.format, memoryview(data))
+            value = self._struct.unpack(data)
+        if self.length <= 2:
+            value = value[0]
         return value
 
     def __set__(self, obj, value):
-        mem_value = struct.pack(self.format, value)
+        if self._struct is None:
+            mem_value = struct.pack(self.format, value)
+        else:
+            mem_value = self._struct.pack(value)
         obj._i2c.writeto_mem(obj._address, self.register, mem_value)
 
 
@@ -146,111 +217,99 @@ class BMP581:
     """
 
     # Power Modes for BMP581
-    STANDBY = const(0x00)
-    NORMAL = const(0x01)
-    FORCED = const(0x02)
-    NON_STOP = const(0x03)
+    STANDBY = _STANDBY
+    NORMAL = _NORMAL
+    FORCED = _FORCED
+    NON_STOP = _NON_STOP
     power_mode_values = (STANDBY, NORMAL, FORCED, NON_STOP)
 
     # Oversample Rate
-    OSR1 = const(0x00)
-    OSR2 = const(0x01)
-    OSR4 = const(0x02)
-    OSR8 = const(0x03)
-    OSR16 = const(0x04)
-    OSR32 = const(0x05)
-    OSR64 = const(0x06)
-    OSR128 = const(0x07)
+    OSR1 = _OSR1
+    OSR2 = _OSR2
+    OSR4 = _OSR4
+    OSR8 = _OSR8
+    OSR16 = _OSR16
+    OSR32 = _OSR32
+    OSR64 = _OSR64
+    OSR128 = _OSR128
 
     # oversampling rates
     pressure_oversample_rate_values = (OSR1, OSR2, OSR4, OSR8, OSR16, OSR32, OSR64, OSR128)
     temperature_oversample_rate_values = (OSR1, OSR2, OSR4, OSR8, OSR16, OSR32, OSR64, OSR128)
 
     # IIR Filters Coefficients
-    COEF_0 = const(0x00)
-    COEF_1 = const(0x01)
-    COEF_3 = const(0x02)
-    COEF_7 = const(0x03)
-    COEF_15 = const(0x04)
-    COEF_31 = const(0x05)
-    COEF_63 = const(0x06)
-    COEF_127 = const(0x07)
+    COEF_0 = _COEF_0
+    COEF_1 = _COEF_1
+    COEF_3 = _COEF_3
+    COEF_7 = _COEF_7
+    COEF_15 = _COEF_15
+    COEF_31 = _COEF_31
+    COEF_63 = _COEF_63
+    COEF_127 = _COEF_127
     iir_coefficient_values = (COEF_0, COEF_1, COEF_3, COEF_7, COEF_15, COEF_31, COEF_63, COEF_127)
 
-    BMP581_I2C_ADDRESS_DEFAULT = 0x47
-    BMP581_I2C_ADDRESS_SECONDARY = 0x46
-
-    # bmp581 Address & Settings
-    _REG_WHOAMI = const(0x01)
-    _INT_STATUS = const(0x27)
-    _DSP_CONFIG = const(0x30)
-    _DSP_IIR = const(0x31)
-    _OSR_CONF = const(0x36)
-    _ODR_CONFIG = const(0x37)
-    _CMD_BMP581 = const(0x7E)
+    BMP581_I2C_ADDRESS_DEFAULT = _I2C_ADDRESS_DEFAULT
+    BMP581_I2C_ADDRESS_SECONDARY = _I2C_ADDRESS_SECONDARY
 
     _device_id = RegisterStruct(_REG_WHOAMI, "B")
-    _SOFTRESET = const(0xB6)  # same value for 585,581,390,280
 
     _cmd_register_BMP581 = CBits(8, _CMD_BMP581, 0)
     _drdy_status = CBits(1, _INT_STATUS, 0)
-    _power_mode = CBits(2, _ODR_CONFIG, 0)
-    _temperature_oversample_rate = CBits(3, _OSR_CONF, 0)
-    _pressure_oversample_rate = CBits(3, _OSR_CONF, 3)
-    _output_data_rate = CBits(5, _ODR_CONFIG, 2)
-    _pressure_enabled = CBits(1, _OSR_CONF, 6)
-    _iir_coefficient = CBits(3, _DSP_IIR, 3)  # Pressure IIR coefficient
-    _iir_temp_coefficient = CBits(3, _DSP_IIR, 0)  # Temp IIR coefficient
-    _iir_control = CBits(8, _DSP_CONFIG, 0)
-    _temperature = CBits(24, 0x1D, 0, 3)
-    _pressure = CBits(24, 0x20, 0, 3)
+    _power_mode = CBits(2, _ODR_CONFIG, 0, cached=True)
+    _temperature_oversample_rate = CBits(3, _OSR_CONF, 0, cached=True)
+    _pressure_oversample_rate = CBits(3, _OSR_CONF, 3, cached=True)
+    _output_data_rate = CBits(5, _ODR_CONFIG, 2, cached=True)
+    _pressure_enabled = CBits(1, _OSR_CONF, 6, cached=True)
+    _iir_coefficient = CBits(3, _DSP_IIR, 3, cached=True)  # Pressure IIR coefficient
+    _iir_coefficients = CBits(6, _DSP_IIR, 0, cached=True)  # Pressure and temp IIR coefficients
+    _iir_control = CBits(8, _DSP_CONFIG, 0, cached=True)
 
     def __init__(self, i2c, address: Union[int, None] = None) -> None:
         time.sleep_ms(3)  # t_powup done in 2ms
 
-        # If no address is provided, try the default, then secondary
-        if address is None:
-            if self._check_address(i2c, self.BMP581_I2C_ADDRESS_DEFAULT):
-                address = self.BMP581_I2C_ADDRESS_DEFAULT
-            elif self._check_address(i2c, self.BMP581_I2C_ADDRESS_SECONDARY):
-                address = self.BMP581_I2C_ADDRESS_SECONDARY
-            else:
-                raise RuntimeError("BMP581 sensor not found at I2C expected address (0x47,0x46).")
+        # If no address is provided, try the default, then secondary.
+        # Probe by reading WHOAMI directly: one transaction per candidate address
+        candidates = (_I2C_ADDRESS_DEFAULT, _I2C_ADDRESS_SECONDARY) if address is None else (address,)
+        for candidate in candidates:
+            try:
+                if i2c.readfrom_mem(candidate, _REG_WHOAMI, 1)[0] == _CHIP_ID:
+                    break
+            except OSError:
+                pass
         else:
-            # Check if the specified address is valid
-            if not self._check_address(i2c, address):
-                raise RuntimeError(f"BMP581 sensor not found at specified I2C address ({hex(address)}).")
+            if address is None:
+                raise RuntimeError("BMP581 sensor not found at I2C expected address (0x47,0x46).")
+            raise RuntimeError(f"BMP581 sensor not found at specified I2C address ({hex(address)}).")
 
         self._i2c = i2c
-        self._address = address
-        if self._read_device_id() != 0x50:  # check _device_id after i2c established
-            raise RuntimeError("Failed to find the BMP581 sensor")
+        self._address = candidate
 
-        self._cmd_register_BMP581 = self._SOFTRESET
+        self._cmd_register_BMP581 = _SOFTRESET
+        self._register_cache = {}  # registers are back to their reset values
         time.sleep_ms(5)  # soft reset finishes in 2ms
 
         # Must be in STANDBY to initialize _iir_coefficient
-        self._power_mode = self.STANDBY
+        self._power_mode = _STANDBY
         time.sleep_ms(5)  # mode change takes 4ms
         self._pressure_enabled = True
         self._output_data_rate = 0  # Default rate
-        self._temperature_oversample_rate = self.OSR1  # Default oversampling
-        self._pressure_oversample_rate = self.OSR1  # Default oversampling
-        self._iir_coefficient = self.COEF_0
-        self._iir_temp_coefficient = self.COEF_0
-        self._power_mode = self.NORMAL
+        self._temperature_oversample_rate = _OSR1  # Default oversampling
+        self._pressure_oversample_rate = _OSR1  # Default oversampling
+        self._iir_coefficients = (_COEF_0 << 3) | _COEF_0
+        self._power_mode = _NORMAL
         time.sleep_ms(5)  # mode change takes 4ms
 
         #         self._drdy_status = 0  # Default data-ready status
         self.sea_level_pressure = WORLD_AVERAGE_SEA_LEVEL_PRESSURE
 
-    def _check_address(self, i2c, address: int) -> bool:
-        """Helper function to check if a device responds at the given I2C address."""
-        try:
-            i2c.writeto(address, b"")  # Attempt a write operation
-            return True
-        except OSError:
-            return False
+        # most recent burst read, reused by readings taken in the same millisecond
+        self._raw_ticks: Union[int, None] = None
+        self._raw_temperature = 0
+        self._raw_pressure = 0
+        self._raw_buffer = bytearray(6)
+        raw_view = memoryview(self._raw_buffer)
+        self._raw_temperature_view = raw_view[0:3]
+        self._raw_pressure_view = raw_view[3:6]
 
     def _read_device_id(self) -> int:
         device_id = self._device_id
@@ -285,19 +344,16 @@ class BMP581:
         | :py:const:`bmp58x.NON_STOP` | :py:const:`0X03` |
         +-----------------------------+------------------+
         """
-        values = (
-            "STANDBY",
-            "NORMAL",
-            "FORCED",
-            "NON_STOP",
-        )
-        return values[self._power_mode]
+        return _POWER_MODE_NAMES[self._power_mode]
 
     @power_mode.setter
     def power_mode(self, value: int) -> None:
-        if value not in self.power_mode_values:
+        if not _STANDBY <= value <= _NON_STOP:
             raise ValueError("Value must be a valid power_mode setting: STANDBY,NORMAL,FORCED,NON_STOP")
         self._power_mode = value
+        if value == _FORCED:
+            # the sensor drops back to STANDBY by itself after a forced measurement
+            self._register_cache.pop(_ODR_CONFIG, None)
 
     @property
     def pressure_oversample_rate(self) -> str:
@@ -320,21 +376,11 @@ class BMP581:
         +---------------------------+------------------+
         :return: sampling rate as string
         """
-        string_name = (
-            "OSR1",
-            "OSR2",
-            "OSR4",
-            "OSR8",
-            "OSR16",
-            "OSR32",
-            "OSR64",
-            "OSR128",
-        )
-        return string_name[self._pressure_oversample_rate]
+        return _OSR_NAMES[self._pressure_oversample_rate]
 
     @pressure_oversample_rate.setter
     def pressure_oversample_rate(self, value: int) -> None:
-        if value not in self.pressure_oversample_rate_values:
+        if not _OSR1 <= value <= _OSR128:
             raise ValueError("Value must be a valid pressure_oversample_rate: OSR1,OSR2,OSR4,OSR8,OSR16,OSR32,OSR64,OSR128")
         self._pressure_oversample_rate = value
 
@@ -356,39 +402,60 @@ class BMP581:
         +---------------------------+------------------+
         :return: sampling rate as string
         """
-        string_name = (
-            "OSR1",
-            "OSR2",
-            "OSR4",
-            "OSR8",
-            "OSR16",
-            "OSR32",
-            "OSR64",
-            "OSR128",
-        )
-        return string_name[self._temperature_oversample_rate]
+        return _OSR_NAMES[self._temperature_oversample_rate]
 
     @temperature_oversample_rate.setter
     def temperature_oversample_rate(self, value: int) -> None:
-        if value not in self.temperature_oversample_rate_values:
+        if not _OSR1 <= value <= _OSR128:
             raise ValueError("Value must be a valid temperature_oversample_rate: OSR1,OSR2,OSR4,OSR8,OSR16,OSR32,OSR64,OSR128")
         self._temperature_oversample_rate = value
 
+    @micropython.native
+    def _read_raw(self) -> Tuple[int, int]:
+        """Read temperature and pressure data registers in a single 6-byte burst."""
+        self._i2c.readfrom_mem_into(self._address, _TEMP_DATA_XLSB, self._raw_buffer)
+        return int.from_bytes(self._raw_temperature_view, "little"), int.from_bytes(self._raw_pressure_view, "little")
+
+    def _cached_raw(self) -> Tuple[int, int]:
+        """
+        Raw (temperature, pressure) shared by all public readers.
+        Every call that lands in a new ticks_ms millisecond does one 6-byte
+        burst read of both channels, so a lone .temperature, .pressure or
+        .altitude access costs 6 bytes on the bus rather than 3. Calls within
+        the same millisecond return the cached pair without touching the bus,
+        which lets .temperature and .pressure read back to back come from the
+        same conversion. The sensor's fastest output rate is 240 Hz (about
+        4 ms per conversion), so a 1 ms window never hides a fresher sample.
+        """
+        now = time.ticks_ms()
+        if self._raw_ticks is None or time.ticks_diff(now, self._raw_ticks) != 0:
+            self._raw_temperature, self._raw_pressure = self._read_raw()
+            self._raw_ticks = now
+        return self._raw_temperature, self._raw_pressure
+
+    def read_measurements(self) -> Tuple[float, float]:
+        """
+        Read temperature and pressure with one I2C transaction
+        :return: (Temperature in Celsius, Pressure in hPa)
+        """
+        raw_temp, raw_pressure = self._cached_raw()
+        return _decode24(raw_temp) / 65536.0, _decode24(raw_pressure) / 64.0 / 100.0
+
     @property
     def temperature(self) -> float:
         """
         :return: Temperature in Celsius
         """
-        raw_temp = self._temperature
-        return self._twos_comp(raw_temp, 24) / 65536.0
+        raw_temp = self._cached_raw()[0]
+        return _decode24(raw_temp) / 65536.0
 
     @property
     def pressure(self) -> float:
         """
         :return: Pressure in hPa
         """
-        raw_pressure = self._pressure
-        return self._twos_comp(raw_pressure, 24) / 64.0 / 100.0
+        raw_pressure = self._cached_raw()[1]
+        return _decode24(raw_pressure) / 64.0 / 100.0
 
     @property
     def altitude(self) -> float:
@@ -397,12 +464,13 @@ class BMP581:
         the altitude in meters is calculated with the international barometric formula
         https://ncar.github.io/aircraft_ProcessingAlgorithms/www/PressureAltitude.pdf
         """
-        altitude = 44330.77 * (1.0 - ((self.pressure / self.sea_level_pressure) ** 0.1902632))
+        ratio = self.pressure * self._inv_sea_level_pressure
+        altitude = _ALTITUDE_SCALE * (1.0 - math.exp(_ALTITUDE_EXPONENT * math.log(ratio)))
         return altitude
 
     @altitude.setter
     def altitude(self, value: float) -> None:
-        self.sea_level_pressure = self.pressure / (1.0 - value / 44330.77) ** (1 / 0.1902632)
+        self.sea_level_pressure = self.pressure / math.exp(math.log(1.0 - value / _ALTITUDE_SCALE) / _ALTITUDE_EXPONENT)
 
     @property
     def sea_level_pressure(self) -> float:
@@ -414,12 +482,7 @@ class BMP581:
     @sea_level_pressure.setter
     def sea_level_pressure(self, value: float) -> None:
         self._sea_level_pressure = value
-
-    @staticmethod
-    def _twos_comp(val: int, bits: int) -> int:
-        if val & (1 << (bits - 1)) != 0:
-            return val - (1 << bits)
-        return val
+        self._inv_sea_level_pressure = 1.0 / value
 
     @property
     def iir_coefficient(self) -> str:
@@ -439,32 +502,24 @@ class BMP581:
         +----------------------------+------------------+
         :return: coefficients as string
         """
-        values = (
-            "COEF_0",
-            "COEF_1",
-            "COEF_3",
-            "COEF_7",
-            "COEF_15",
-            "COEF_31",
-            "COEF_63",
-            "COEF_127",
-        )
-        return values[self._iir_coefficient]
+        return _COEF_NAMES[self._iir_coefficient]
 
     @iir_coefficient.setter
     def iir_coefficient(self, value: int) -> None:
-        if value not in self.iir_coefficient_values:
+        if not _COEF_0 <= value <= _COEF_127:
             raise ValueError("Value must be a valid iir_coefficients: COEF_0,COEF_1,COEF_3,COEF_7,COEF_15,COEF_31,COEF_63,COEF_127")
 
         # Ensure the sensor is in STANDBY mode before updating
         original_mode = self._power_mode  # Save the current mode
-        if original_mode != self.STANDBY:
-            self.power_mode = self.STANDBY  # Set to STANDBY if not already
-        self._iir_coefficient = value
-        self._iir_temp_coefficient = value
+        if original_mode != _STANDBY:
+            self.power_mode = _STANDBY  # Set to STANDBY if not already
+
+        # Both coefficients live in _DSP_IIR, update them with a single write
+        self._iir_coefficients = (value << 3) | value
 
         # Restore the original power mode
-        self.power_mode = original_mode
+        if original_mode != _STANDBY:
+            self.power_mode = original_mode
 
     @property
     def output_data_rate(self) -> int:
@@ -475,6 +530,6 @@ class BMP581:
 
     @output_data_rate.setter
     def output_data_rate(self, value: int) -> None:
-        if value not in range(0, 32, 1):
+        if not 0 <= value < 32:
             raise ValueError("Value must be a valid output_data_rate setting: 0 to 32")
         self._output_data_rate = value
@@ -11,9 +11,7 @@ class UartError(Exception):
 class Pms7003:
 
     START_BYTE_1 = 0x42
-    START_BYTE_1_BYTES = bytes([START_BYTE_1])
     START_BYTE_2 = 0x4D
-    START_BYTE_2_BYTES = bytes([START_BYTE_2])
 
     PMS_FRAME_LENGTH = 0
     PMS_PM1_0 = 1
@@ -32,6 +30,8 @@ class Pms7003:
     PMS_ERROR = 14
     PMS_CHECKSUM = 15
 
+    FRAME_LENGTH = 32
+
     def __init__(self, uart, tx=None, rx=None):
         kwargs = {}
         if tx is not None:
@@ -39,7 +39,13 @@ class Pms7003:
         if rx is not None:
             kwargs['rx'] = rx
         self.uart = machine.UART(uart, baudrate=9600, bits=8, parity=None, stop=1, timeout=200, **kwargs)
-        self._buffer = bytearray()
+
+        # Streaming frame parser state: bytes are consumed once as they arrive
+        self._frame = bytearray(Pms7003.FRAME_LENGTH)
+        self._index = 0  # next position in _frame
+        self._running_sum = 0  # sum of frame bytes 0..29, checked against bytes 30..31
+        self._ready = False
+        self._parsing = False
 
         self._pm1_0_standard: Union[int, None] = None
         self._pm2_5_standard: Union[int, None] = None
@@ -56,6 +62,8 @@ class Pms7003:
         self._version: Union[int, None] = None
         self._error: Union[int, None] = None
 
+        self._enable_rx_irq()
+
     def __repr__(self):
         return "Pms7003({})".format(self.uart)
 
@@ -69,7 +77,121 @@ class Pms7003:
     def _format_bytearray(buffer):
         return "".join("0x{:02x} ".format(i) for i in buffer)
 
+    def _enable_rx_irq(self):
+        # Parse as soon as the line goes idle after a burst; ports without
+        # UART.irq fall back to parsing whenever data_ready is polled
+        try:
+            self.uart.irq(handler=self._on_rx, trigger=machine.UART.IRQ_RXIDLE)
+        except (AttributeError, ValueError):
+            pass
+
+    def _disable_rx_irq(self):
+        try:
+            self.uart.irq(handler=None)
+        except (AttributeError, ValueError, TypeError):
+            pass
+
+    def _on_rx(self, uart):
+        # The scheduled handler can run between bytecodes of a data_ready
+        # call; leave the bytes to that call instead of re-entering the parser
+        if not self._parsing:
+            self._read_available()
+
+    def _read_available(self):
+        self._parsing = True
+        try:
+            while self.uart.any():
+                data = self.uart.read()
+                if data:
+                    if len(data) > 2 * Pms7003.FRAME_LENGTH:
+                        # Frames are back to back, so the last 64 bytes always hold the
+                        # newest complete frame: skip the backlog instead of parsing it
+                        data = memoryview(data)[-2 * Pms7003.FRAME_LENGTH:]
+                        self._index = 0
+                    self._feed(data)
+        finally:
+            self._parsing = False
+
+    def _feed(self, data):
+        """Run received bytes through the frame state machine"""
+        # Parser state and constants live in locals for the byte loop
+        frame = self._frame
+        index = self._index
+        running_sum = self._running_sum
+        start_byte_1 = Pms7003.START_BYTE_1
+        start_byte_2 = Pms7003.START_BYTE_2
+        frame_length = Pms7003.FRAME_LENGTH
+        for byte in data:
+            if index == 0:
+                # wait for START_BYTE_1
+                if byte != start_byte_1:
+                    continue
+                running_sum = byte
+            elif index == 1:
+                # wait for START_BYTE_2
+                if byte != start_byte_2:
+                    index = 1 if byte == start_byte_1 else 0
+                    continue
+                running_sum += byte
+            elif index == 3:
+                # frame length is fixed: drop a bad header now rather than after 32 bytes,
+                # keeping any header start among the bytes already accepted
+                if ((frame[2] << 8) | byte) != frame_length - 4:
+                    frame[3] = byte
+                    index = Pms7003._resync(frame, 4)
+                    running_sum = sum(frame[:index])
+                    continue
+                running_sum += byte
+            elif index < 30:
+                # frame length and body
+                running_sum += byte
+            frame[index] = byte
+            index += 1
+
+            if index < frame_length:
+                continue
+
+            # full frame received, verify checksum
+            expected_checksum = (frame[30] << 8) | frame[31]
+            if running_sum == expected_checksum:
+                index = 0
+                values = struct.unpack_from("!HHHHHHHHHHHHHBBH", frame, 2)
+                self._update_data(values)
+                self._ready = True
+            else:
+                # a dropped or garbled byte: the next frame's header may
+                # already be buffered, so restart from it instead of from scratch
+                index = Pms7003._resync(frame, frame_length)
+                running_sum = sum(frame[:min(index, 30)])  # checksum bytes excluded
+
+        self._index = index
+        self._running_sum = running_sum
+
+    @staticmethod
+    def _resync(frame, end):
+        """Move the first plausible frame start in frame[1:end] to the front, return its length"""
+        frame_length = Pms7003.FRAME_LENGTH
+        for start in range(1, end):
+            if frame[start] != Pms7003.START_BYTE_1:
+                continue
+            length = end - start
+            if length > 1 and frame[start + 1] != Pms7003.START_BYTE_2:
+                continue
+            if length > 3 and ((frame[start + 2] << 8) | frame[start + 3]) != frame_length - 4:
+                continue
+            frame[0:length] = frame[start:end]
+            return length
+        return 0
+
     def _send_cmd(self, request, response):
+        # Responses are read directly, keep the frame parser from consuming them
+        self._disable_rx_irq()
+        try:
+            self._send_request(request, response)
+        finally:
+            self._enable_rx_irq()
+
+    def _send_request(self, request, response):
 
         nr_of_written_bytes = self.uart.write(request)
 
@@ -87,72 +209,13 @@ class Pms7003:
 
     @property
     def data_ready(self):
-        # Read all available data into buffer
-        while self.uart.any():
-            data = self.uart.read()
-            if data:
-                self._buffer.extend(data)
-
-        # Iterate backwards to find the latest valid frame
-        # We start searching for START_BYTE_1 from the end
-        limit = len(self._buffer)
-        
-        while True:
-            # Find last occurrence of START_BYTE_1 before 'limit'
-            start_idx = self._buffer.rfind(self.START_BYTE_1_BYTES, 0, limit)
-            
-            if start_idx == -1:
-                # No start byte found
-                break
-                
-            # Check if we have header 0x42 0x4D
-            # Need at least 2 bytes (start_idx + 1 must exist)
-            if start_idx + 1 >= len(self._buffer):
-                # This 0x42 is at the very end. Keep it for next time.
-                limit = start_idx
-                continue
+        """True once for every new valid frame received since the last call"""
+        # Parse anything the RX interrupt has not consumed yet
+        self._read_available()
 
-            if self._buffer[start_idx + 1] != self.START_BYTE_2:
-                # Not a valid header
-                limit = start_idx
-                continue
-                
-            # Check if we have a full frame (32 bytes)
-            if start_idx + 32 > len(self._buffer):
-                # We have a header but not enough data for full frame yet.
-                # This could be the start of the NEWEST packet arriving.
-                # We should NOT discard it, but we can't process it yet.
-                # Continue searching backwards for an *older* complete packet?
-                # User wants "most recent". If the most recent is partial, 
-                # we can't use it. We should look for the most recent *complete* packet.
-                limit = start_idx
-                continue
-                
-            # We have 32 bytes. Verify checksum.
-            frame = self._buffer[start_idx : start_idx + 32]
-            
-            calculated_checksum = sum(frame[:30])
-            expected_checksum = (frame[30] << 8) | frame[31]
-            
-            if calculated_checksum == expected_checksum:
-                # Valid frame found!
-                data = struct.unpack("!HHHHHHHHHHHHHBBH", frame[2:])
-                self._update_data(data)
-                
-                # Keep only what follows this frame (partial newer data)
-                self._buffer = self._buffer[start_idx + 32:]
-                return True
-            else:
-                # Invalid checksum
-                limit = start_idx
-                continue
-                
-        # If buffer is getting too large with no valid data, trim it to prevent OOM
-        # Keep last 64 bytes (enough for a split frame)
-        if len(self._buffer) > 100:
-             self._buffer = self._buffer[-64:]
-             
-        return False
+        ready = self._ready
+        self._ready = False
+        return ready
 
     def _update_data(self, data: Tuple[int, ...]):
         self._pm1_0_standard = data[Pms7003.PMS_PM1_0]
@@ -5,50 +5,137 @@ Based on Sensirion I2C SGP41 Driver
 
 import time
 import struct
+import micropython
 from machine import I2C
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
 from sgp41_gas_index_algorithm import GasIndexAlgorithm
 
+
+def _build_crc_table() -> bytes:
+    # CRC-8, polynomial 0x31, one entry per input byte
+    table = bytearray(256)
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            # branchless step: xor in the polynomial when the MSB shifts out
+            crc = ((crc << 1) ^ (0x31 * (crc >> 7))) & 0xFF
+        table[i] = crc
+    return bytes(table)
+
+
+_CRC8_TABLE = _build_crc_table()
+
+# One 64 KB lookup per word instead of two byte lookups; only worth it with PSRAM to spare
+ENABLE_LARGE_CRC_TABLE = False
+
+# Prebuilt struct format (MicroPython has no struct.Struct)
+_RH_T_FORMAT = '>HHBHB'
+
+
+if ENABLE_LARGE_CRC_TABLE:
+    def _build_word_crc_table() -> bytes:
+        # CRC-8 (init 0xFF) of every 2-byte word, indexed by the word itself
+        table = bytearray(65536)
+        for w in range(65536):
+            table[w] = _CRC8_TABLE[_CRC8_TABLE[0xFF ^ (w >> 8)] ^ (w & 0xFF)]
+        return bytes(table)
+
+    _CRC8_WORD_TABLE = _build_word_crc_table()
+
+    def _crc_word(b0: int, b1: int) -> int:
+        """CRC-8 (init 0xFF) of one 2-byte word"""
+        return _CRC8_WORD_TABLE[(b0 << 8) | b1]
+else:
+    def _crc_word(b0: int, b1: int) -> int:
+        """CRC-8 (init 0xFF) of one 2-byte word"""
+        return _CRC8_TABLE[_CRC8_TABLE[0xFF ^ b0] ^ b1]
+
+
 class SGP41:
-    def __init__(self, i2c: I2C, address: int = 0x59, sampling_interval: float = 1.0) -> None:
+    # Commands without payload, written as-is
+    _CMD_SELF_TEST = b'\x28\x0e'
+    _CMD_HEATER_OFF = b'\x36\x15'
+    _CMD_SERIAL = b'\x36\x82'
+
+    def __init__(self, i2c: I2C, address: int = 0x59, sampling_interval: float = 1.0, verify_crc: bool = True) -> None:
         self._i2c = i2c
         self._addr = address
+        self._verify_crc = verify_crc  # False skips the CRC check of received words
+        self._tx8 = bytearray(8)  # command + RH word/CRC + T word/CRC
+        rx = memoryview(bytearray(9))  # up to 3 words with CRCs
+        self._rx_views = (None, rx[:3], rx[:6], rx)  # preallocated views by word count
+        self._ready_at = 0  # ticks_ms when a started measurement is done
+        # Prebuilt packets for the default RH/T payload
+        self._pkt_measure_default = bytes(self._pack_rh_t(0x2619, 0x8000, 0x6666))
+        self._pkt_condition_default = bytes(self._pack_rh_t(0x2612, 0x8000, 0x6666))
         self._voc_algo = GasIndexAlgorithm(GasIndexAlgorithm.ALGORITHM_TYPE_VOC, sampling_interval)
         self._nox_algo = GasIndexAlgorithm(GasIndexAlgorithm.ALGORITHM_TYPE_NOX, sampling_interval)
 
-    def _crc(self, data: bytes) -> int:
-        crc = 0xFF
-        for b in data:
-            crc ^= b
-            for _ in range(8):
-                if crc & 0x80:
-                    crc = (crc << 1) ^ 0x31
-                else:
-                    crc = crc << 1
-        return crc & 0xFF
-
-    def _write_command(self, command: int, data: Optional[bytes] = None) -> None:
-        buf = struct.pack('>H', command)
-        if data:
-            for i in range(0, len(data), 2):
-                chunk = data[i:i+2]
-                buf += chunk
-                buf += struct.pack('B', self._crc(chunk))
-        self._i2c.writeto(self._addr, buf)
-
-    def _read_result(self, length: int) -> bytes:
+    def _pack_rh_t(self, command: int, rh_raw: int, t_raw: int) -> bytearray:
+        # Command followed by the (RH, T) compensation words, each with its CRC
+        buf = self._tx8
+        struct.pack_into(_RH_T_FORMAT, buf, 0, command,
+                         rh_raw, _crc_word(rh_raw >> 8, rh_raw & 0xFF),
+                         t_raw, _crc_word(t_raw >> 8, t_raw & 0xFF))
+        return buf
+
+    def _write_command_rh_t(self, command: int, rh_raw: int, t_raw: int) -> None:
+        self._i2c.writeto(self._addr, self._pack_rh_t(command, rh_raw, t_raw))
+
+    def _rh_t_raw(self, relative_humidity: Optional[float], temperature: Optional[float],
+            rh_raw: Optional[int], t_raw: Optional[int]) -> Tuple[int, int]:
+        # Compensation words in sensor ticks; rh_raw/t_raw are used as-is without float scaling
+        if rh_raw is None:
+            if relative_humidity is None:
+                rh_raw = 0x8000
+            else:
+                rh_raw = int(relative_humidity * 65535 / 100)
+
+        if t_raw is None:
+            if temperature is None:
+                t_raw = 0x6666
+            else:
+                t_raw = int((temperature + 45) * 65535 / 175)
+        return rh_raw, t_raw
+
+    @micropython.native
+    def _read_result(self, length: int, exec_ms: int = 0) -> List[int]:
         # length is number of bytes to read (including CRC)
-        data = self._i2c.readfrom(self._addr, length)
-        result = bytearray()
+        # exec_ms is the command's remaining max execution time
+        # returns the CRC-checked 16-bit words
+        # The sensor NACKs its address until the result is ready: sleep until
+        # shortly before the execution time is up, then poll the last stretch
+        # (every NACK costs a bus transaction and an OSError allocation)
+        lead = 5 if exec_ms > 5 else 0
+        if exec_ms - lead > 0:
+            time.sleep_ms(exec_ms - lead)
+        readfrom_into = self._i2c.readfrom_into
+        addr = self._addr
+        data = self._rx_views[length // 3]
+        deadline = time.ticks_add(time.ticks_ms(), lead + 10)
+        while True:
+            try:
+                readfrom_into(addr, data)
+                break
+            except OSError:
+                if time.ticks_diff(deadline, time.ticks_ms()) <= 0:
+                    raise
+                time.sleep_ms(1)
+        # single pass: check each word against the table CRC while extracting it
+        table = _CRC8_TABLE
+        verify = self._verify_crc
+        words = []
+        append = words.append
         for i in range(0, length, 3):
-            word = data[i:i+2]
-            crc = data[i+2]
-            if self._crc(word) != crc:
+            b0 = data[i]
+            b1 = data[i + 1]
+            if verify and table[table[0xFF ^ b0] ^ b1] != data[i + 2]:
                 raise RuntimeError("CRC Error")
-            result.extend(word)
-        return bytes(result)
+            append((b0 << 8) | b1)
+        return words
         
-    def execute_conditioning(self, relative_humidity: Optional[float] = None, temperature: Optional[float] = None) -> int:
+    def execute_conditioning(self, relative_humidity: Optional[float] = None, temperature: Optional[float] = None,
+            rh_raw: Optional[int] = None, t_raw: Optional[int] = None) -> int:
         """
         This command starts the conditioning, i.e., the VOC pixel will be operated
         at the same temperature as it is by calling the measure_raw command
@@ -60,65 +147,68 @@ class SGP41:
         
         Returns: int (raw VOC ticks)
         """
-        if relative_humidity is None:
-            rh_raw = 0x8000
+        # Command: 0x2612
+        if rh_raw is None and t_raw is None and relative_humidity is None and temperature is None:
+            self._i2c.writeto(self._addr, self._pkt_condition_default)
         else:
-            rh_raw = int(relative_humidity * 65535 / 100)
-            
-        if temperature is None:
-            t_raw = 0x6666
+            self._write_command_rh_t(0x2612, *self._rh_t_raw(relative_humidity, temperature, rh_raw, t_raw))
+        resp = self._read_result(3, 50) # 2 bytes data + 1 CRC, ready within 50ms
+        return resp[0]
+
+    def start_measure_raw(self, relative_humidity: Optional[float] = None, temperature: Optional[float] = None,
+            rh_raw: Optional[int] = None, t_raw: Optional[int] = None) -> None:
+        """
+        Start a raw VOC/NOx measurement without waiting for it.
+        
+        Other work can be done during the 50ms measurement time, then
+        read_measure_raw() collects the result.
+        """
+        # Command: 0x2619
+        if rh_raw is None and t_raw is None and relative_humidity is None and temperature is None:
+            self._i2c.writeto(self._addr, self._pkt_measure_default)
         else:
-            t_raw = int((temperature + 45) * 65535 / 175)
-            
-        # Command: 0x2612
-        payload = struct.pack('>HH', rh_raw, t_raw)
-        self._write_command(0x2612, payload)
-        time.sleep(0.05)
-        resp = self._read_result(3) # 2 bytes data + 1 CRC
-        return struct.unpack('>H', resp)[0]
+            self._write_command_rh_t(0x2619, *self._rh_t_raw(relative_humidity, temperature, rh_raw, t_raw))
+        self._ready_at = time.ticks_add(time.ticks_ms(), 50)
 
-    def measure_raw(self, relative_humidity: Optional[float] = None, temperature: Optional[float] = None) -> Tuple[int, int]:
+    def read_measure_raw(self) -> Tuple[int, int]:
         """
-        Read raw VOC signal and raw NOx signal.
+        Read the result of start_measure_raw().
+        
+        Sleeps for what is left of the measurement time, polling only the
+        last few milliseconds for the result.
         
         Returns: tuple(int, int) -> (voc_ticks, nox_ticks)
         """
-        if relative_humidity is None:
-            rh_raw = 0x8000
-        else:
-            rh_raw = int(relative_humidity * 65535 / 100)
-            
-        if temperature is None:
-            t_raw = 0x6666
-        else:
-            t_raw = int((temperature + 45) * 65535 / 175)
-            
-        # Command: 0x2619
-        payload = struct.pack('>HH', rh_raw, t_raw)
-        self._write_command(0x2619, payload)
-        time.sleep(0.05)
-        resp = self._read_result(6) # 2 words * (2 bytes + 1 CRC)
-        voc_ticks = struct.unpack('>H', resp[0:2])[0]
-        nox_ticks = struct.unpack('>H', resp[2:4])[0]
+        remaining = time.ticks_diff(self._ready_at, time.ticks_ms())
+        voc_ticks, nox_ticks = self._read_result(6, max(remaining, 0)) # 2 words * (2 bytes + 1 CRC)
         return voc_ticks, nox_ticks
 
+    def measure_raw(self, relative_humidity: Optional[float] = None, temperature: Optional[float] = None,
+            rh_raw: Optional[int] = None, t_raw: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Read raw VOC signal and raw NOx signal.
+        
+        Returns: tuple(int, int) -> (voc_ticks, nox_ticks)
+        """
+        self.start_measure_raw(relative_humidity, temperature, rh_raw, t_raw)
+        return self.read_measure_raw()
+
     def execute_self_test(self) -> int:
         """
         Triggers the built-in self-test.
         Returns 0xD400 if all tests passed successfully.
         """
         # Command: 0x280E
-        self._write_command(0x280E)
-        time.sleep(0.32)
-        resp = self._read_result(3)
-        return struct.unpack('>H', resp)[0]
+        self._i2c.writeto(self._addr, SGP41._CMD_SELF_TEST)
+        resp = self._read_result(3, 320) # ready within 320ms
+        return resp[0]
 
     def turn_heater_off(self) -> None:
         """
         Turns the hotplate off and stops the measurement.
         """
         # Command: 0x3615
-        self._write_command(0x3615)
+        self._i2c.writeto(self._addr, SGP41._CMD_HEATER_OFF)
         time.sleep(0.001) # Post processing time
         
     def get_serial_number(self) -> int:
@@ -126,11 +216,8 @@ class SGP41:
         Returns the 48-bit serial number as an int.
         """
         # Command: 0x3682
-        self._write_command(0x3682)
-        time.sleep(0.001)
-        resp = self._read_result(9) # 3 words * 3 bytes
-        # resp has CRCs stripped by _read_result, so it is 6 bytes long
-        words = struct.unpack('>HHH', resp)
+        self._i2c.writeto(self._addr, SGP41._CMD_SERIAL)
+        words = self._read_result(9, 1) # 3 words * 3 bytes, waits the 1ms execution time
         return (words[0] << 32) | (words[1] << 16) | words[2]
         
     def measure_index(self, relative_humidity: Optional[float] = None, temperature: Optional[float] = None) -> Tuple[int, int]:
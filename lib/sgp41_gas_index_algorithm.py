@@ -112,6 +112,11 @@ class GasIndexAlgorithm:
     _MEAN_VARIANCE_ESTIMATOR_GAMMA_SCALING = 64.0
     _MEAN_VARIANCE_ESTIMATOR_ADDITIONAL_GAMMA_MEAN_SCALING = 8.0
     _MEAN_VARIANCE_ESTIMATOR_FIX16_MAX = 32767.0
+    _INV_GAMMA_SCALING = 1.0 / 64.0
+    _INV_ADD_GAMMA_MEAN = 1.0 / 8.0
+    # ADDITIONAL_GAMMA_MEAN_SCALING * GAMMA_SCALING
+    _MVE_SIGMA_RATIO = 8.0 * 64.0
+    _INV_3600 = 1.0 / 3600.0
 
     def __init__(self, algorithm_type, sampling_interval=None):
         """
@@ -128,6 +133,14 @@ class GasIndexAlgorithm:
         self._algorithm_type = int(algorithm_type)
         self._sampling_interval = float(sampling_interval)
 
+        # The type is fixed per instance, so per-type variants are bound once
+        # here instead of branching on every sample
+        self._is_voc = self._algorithm_type != self.ALGORITHM_TYPE_NOX
+        if self._is_voc:
+            self._mox_model_process = self._mox_model_process_voc
+        else:
+            self._mox_model_process = self._mox_model_process_nox
+
         # C: GasIndexAlgorithm_init_with_sampling_interval
         if algorithm_type == self.ALGORITHM_TYPE_NOX:
             self._index_offset = self._NOX_INDEX_OFFSET_DEFAULT
@@ -144,6 +157,10 @@ class GasIndexAlgorithm:
             self._init_duration_variance = self._INIT_DURATION_VARIANCE_VOC
             self._gating_threshold = self._GATING_THRESHOLD_VOC
 
+        # Clamp bounds for sraw in process(); _sraw_minimum is fixed per type
+        self._sraw_min_low = self._sraw_minimum + 1
+        self._sraw_min_high = self._sraw_minimum + 32767
+
         self._index_gain = self._INDEX_GAIN
         self._tau_mean_hours = self._TAU_MEAN_HOURS
         self._tau_variance_hours = self._TAU_VARIANCE_HOURS
@@ -170,6 +187,10 @@ class GasIndexAlgorithm:
         self._mve_gating_duration_minutes = 0.0
         self._mve_sigmoid_k = 0.0
         self._mve_sigmoid_x0 = 0.0
+        # Per-parameter-set constants of _mean_variance_estimator_calculate_gamma
+        self._mve_uptime_limit = 0.0
+        self._mve_gating_delta = 0.0
+        self._mve_sampling_over_60 = 0.0
 
         # Mox model state
         self._mox_sraw_std = 0.0
@@ -179,10 +200,16 @@ class GasIndexAlgorithm:
         self._sigmoid_scaled_k = 0.0
         self._sigmoid_scaled_x0 = 0.0
         self._sigmoid_scaled_offset_default = 0.0
+        # Derived from _index_offset and the offset default, cached per parameter set
+        self._sigmoid_scaled_shift = 0.0
+        self._sigmoid_scaled_l_plus_shift = 0.0
+        self._sigmoid_scaled_negative_gain = 0.0
 
         # Adaptive lowpass state
         self._lp_a1 = 0.0
         self._lp_a2 = 0.0
+        self._lp_one_minus_a1 = 1.0
+        self._lp_one_minus_a2 = 1.0
         self._lp_initialized = False
         self._lp_x1 = 0.0
         self._lp_x2 = 0.0
@@ -321,37 +348,37 @@ class GasIndexAlgorithm:
         Returns:
             int: Gas index value (0 during blackout, 1..500 afterwards)
         """
-        if self._uptime <= self._INITIAL_BLACKOUT:
-            self._uptime = self._uptime + self._sampling_interval
+        # State is read into locals once; the trivial mve accessors are inlined
+        uptime = self._uptime
+        if uptime <= self._INITIAL_BLACKOUT:
+            self._uptime = uptime + self._sampling_interval
+            return int(self._gas_index + 0.5)
+
+        if (sraw > 0) and (sraw < 65000):
+            sraw = min(max(sraw, self._sraw_min_low), self._sraw_min_high)
+            self._sraw = float(sraw - self._sraw_minimum)
+        sraw_f = self._sraw
+
+        if self._is_voc or self._mve_initialized:
+            gas_index = self._sigmoid_scaled_process(
+                self._mox_model_process(sraw_f)
+            )
         else:
-            if (sraw > 0) and (sraw < 65000):
-                if sraw < (self._sraw_minimum + 1):
-                    sraw = self._sraw_minimum + 1
-                elif sraw > (self._sraw_minimum + 32767):
-                    sraw = self._sraw_minimum + 32767
-                self._sraw = float(sraw - self._sraw_minimum)
-
-            if (
-                self._algorithm_type == self.ALGORITHM_TYPE_VOC
-                or self._mean_variance_estimator_is_initialized()
-            ):
-                self._gas_index = self._mox_model_process(self._sraw)
-                self._gas_index = self._sigmoid_scaled_process(self._gas_index)
-            else:
-                self._gas_index = self._index_offset
-
-            self._gas_index = self._adaptive_lowpass_process(self._gas_index)
-            if self._gas_index < 0.5:
-                self._gas_index = 0.5
-
-            if self._sraw > 0.0:
-                self._mean_variance_estimator_process(self._sraw)
-                self._mox_model_set_parameters(
-                    self._mean_variance_estimator_get_std(),
-                    self._mean_variance_estimator_get_mean(),
-                )
+            gas_index = self._index_offset
+
+        gas_index = self._adaptive_lowpass_process(gas_index)
+        if gas_index < 0.5:
+            gas_index = 0.5
+        # Stored before the estimator update, which gates on the current index
+        self._gas_index = gas_index
+
+        if sraw_f > 0.0:
+            self._mean_variance_estimator_process(sraw_f)
+            self._mox_model_set_parameters(
+                self._mve_std, self._mve_mean + self._mve_sraw_offset
+            )
 
-        return int(self._gas_index + 0.5)
+        return int(gas_index + 0.5)
 
     # ================================================================
     # Mean Variance Estimator
@@ -363,42 +390,36 @@ class GasIndexAlgorithm:
         self._mve_mean = 0.0
         self._mve_sraw_offset = 0.0
         self._mve_std = self._sraw_std_initial
-        self._mve_gamma_mean = (
-            (
-                self._MEAN_VARIANCE_ESTIMATOR_ADDITIONAL_GAMMA_MEAN_SCALING
-                * self._MEAN_VARIANCE_ESTIMATOR_GAMMA_SCALING
-            )
-            * (self._sampling_interval / 3600.0)
-        ) / (self._tau_mean_hours + (self._sampling_interval / 3600.0))
+        ts = self._sampling_interval
+        dt_h = ts * self._INV_3600  # sampling interval in hours
+        self._mve_gamma_mean = (self._MVE_SIGMA_RATIO * dt_h) / (
+            self._tau_mean_hours + dt_h
+        )
         self._mve_gamma_variance = (
-            self._MEAN_VARIANCE_ESTIMATOR_GAMMA_SCALING
-            * (self._sampling_interval / 3600.0)
-        ) / (self._tau_variance_hours + (self._sampling_interval / 3600.0))
+            self._MEAN_VARIANCE_ESTIMATOR_GAMMA_SCALING * dt_h
+        ) / (self._tau_variance_hours + dt_h)
         if self._algorithm_type == self.ALGORITHM_TYPE_NOX:
-            self._mve_gamma_initial_mean = (
-                (
-                    self._MEAN_VARIANCE_ESTIMATOR_ADDITIONAL_GAMMA_MEAN_SCALING
-                    * self._MEAN_VARIANCE_ESTIMATOR_GAMMA_SCALING
-                )
-                * self._sampling_interval
-            ) / (self._TAU_INITIAL_MEAN_NOX + self._sampling_interval)
+            tau_initial_mean = self._TAU_INITIAL_MEAN_NOX
         else:
-            self._mve_gamma_initial_mean = (
-                (
-                    self._MEAN_VARIANCE_ESTIMATOR_ADDITIONAL_GAMMA_MEAN_SCALING
-                    * self._MEAN_VARIANCE_ESTIMATOR_GAMMA_SCALING
-                )
-                * self._sampling_interval
-            ) / (self._TAU_INITIAL_MEAN_VOC + self._sampling_interval)
+            tau_initial_mean = self._TAU_INITIAL_MEAN_VOC
+        self._mve_gamma_initial_mean = (self._MVE_SIGMA_RATIO * ts) / (
+            tau_initial_mean + ts
+        )
         self._mve_gamma_initial_variance = (
-            self._MEAN_VARIANCE_ESTIMATOR_GAMMA_SCALING
-            * self._sampling_interval
-        ) / (self._TAU_INITIAL_VARIANCE + self._sampling_interval)
+            self._MEAN_VARIANCE_ESTIMATOR_GAMMA_SCALING * ts
+        ) / (self._TAU_INITIAL_VARIANCE + ts)
         self._mve_gc_gamma_mean = 0.0
         self._mve_gc_gamma_variance = 0.0
         self._mve_uptime_gamma = 0.0
         self._mve_uptime_gating = 0.0
         self._mve_gating_duration_minutes = 0.0
+        self._mve_uptime_limit = (
+            self._MEAN_VARIANCE_ESTIMATOR_FIX16_MAX - self._sampling_interval
+        )
+        self._mve_gating_delta = (
+            self._GATING_THRESHOLD_INITIAL - self._gating_threshold
+        )
+        self._mve_sampling_over_60 = self._sampling_interval / 60.0
 
     # C: GasIndexAlgorithm__mean_variance_estimator__set_states
     def _mean_variance_estimator_set_states(self, mean, std, uptime_gamma):
@@ -421,9 +442,7 @@ class GasIndexAlgorithm:
 
     # C: GasIndexAlgorithm__mean_variance_estimator___calculate_gamma
     def _mean_variance_estimator_calculate_gamma(self):
-        uptime_limit = (
-            self._MEAN_VARIANCE_ESTIMATOR_FIX16_MAX - self._sampling_interval
-        )
+        uptime_limit = self._mve_uptime_limit
 
         if self._mve_uptime_gamma < uptime_limit:
             self._mve_uptime_gamma = (
@@ -435,20 +454,30 @@ class GasIndexAlgorithm:
                 self._mve_uptime_gating + self._sampling_interval
             )
 
+        # Past the learning phase the uptime sigmoids sit in their x > 50
+        # clamp and return exactly 0.0, so the calls (and the mean blend,
+        # which then equals _mve_gamma_mean) are skipped
+        uptime_gamma = self._mve_uptime_gamma
         self._mean_variance_estimator_sigmoid_set_parameters(
             self._init_duration_mean, self._INIT_TRANSITION_MEAN
         )
-        sigmoid_gamma_mean = self._mean_variance_estimator_sigmoid_process(
-            self._mve_uptime_gamma
-        )
-
-        gamma_mean = self._mve_gamma_mean + (
-            (self._mve_gamma_initial_mean - self._mve_gamma_mean)
-            * sigmoid_gamma_mean
-        )
+        if (
+            self._INIT_TRANSITION_MEAN * (uptime_gamma - self._init_duration_mean)
+            > 50.0
+        ):
+            sigmoid_gamma_mean = 0.0
+            gamma_mean = self._mve_gamma_mean
+        else:
+            sigmoid_gamma_mean = self._mean_variance_estimator_sigmoid_process(
+                uptime_gamma
+            )
+            gamma_mean = self._mve_gamma_mean + (
+                (self._mve_gamma_initial_mean - self._mve_gamma_mean)
+                * sigmoid_gamma_mean
+            )
 
         gating_threshold_mean = self._gating_threshold + (
-            (self._GATING_THRESHOLD_INITIAL - self._gating_threshold)
+            self._mve_gating_delta
             * self._mean_variance_estimator_sigmoid_process(
                 self._mve_uptime_gating
             )
@@ -466,9 +495,16 @@ class GasIndexAlgorithm:
         self._mean_variance_estimator_sigmoid_set_parameters(
             self._init_duration_variance, self._INIT_TRANSITION_VARIANCE
         )
-        sigmoid_gamma_variance = self._mean_variance_estimator_sigmoid_process(
-            self._mve_uptime_gamma
-        )
+        if (
+            self._INIT_TRANSITION_VARIANCE
+            * (uptime_gamma - self._init_duration_variance)
+            > 50.0
+        ):
+            sigmoid_gamma_variance = 0.0
+        else:
+            sigmoid_gamma_variance = (
+                self._mean_variance_estimator_sigmoid_process(uptime_gamma)
+            )
 
         gamma_variance = self._mve_gamma_variance + (
             (self._mve_gamma_initial_variance - self._mve_gamma_variance)
@@ -476,7 +512,7 @@ class GasIndexAlgorithm:
         )
 
         gating_threshold_variance = self._gating_threshold + (
-            (self._GATING_THRESHOLD_INITIAL - self._gating_threshold)
+            self._mve_gating_delta
             * self._mean_variance_estimator_sigmoid_process(
                 self._mve_uptime_gating
             )
@@ -494,7 +530,7 @@ class GasIndexAlgorithm:
         self._mve_gating_duration_minutes = (
             self._mve_gating_duration_minutes
             + (
-                (self._sampling_interval / 60.0)
+                self._mve_sampling_over_60
                 * (
                     ((1.0 - sigmoid_gating_mean) * (1.0 + self._GATING_MAX_RATIO))
                     - self._GATING_MAX_RATIO
@@ -510,7 +546,7 @@ class GasIndexAlgorithm:
 
     # C: GasIndexAlgorithm__mean_variance_estimator__process
     def _mean_variance_estimator_process(self, sraw):
-        if self._mve_initialized == False:
+        if not self._mve_initialized:
             self._mve_initialized = True
             self._mve_sraw_offset = sraw
             self._mve_mean = 0.0
@@ -522,48 +558,35 @@ class GasIndexAlgorithm:
             sraw = sraw - self._mve_sraw_offset
             self._mean_variance_estimator_calculate_gamma()
 
-            delta_sgp = (sraw - self._mve_mean) / (
-                self._MEAN_VARIANCE_ESTIMATOR_GAMMA_SCALING
-            )
+            delta_sgp = (sraw - self._mve_mean) * self._INV_GAMMA_SCALING
 
+            std = self._mve_std
+            gc_gamma_variance = self._mve_gc_gamma_variance
             if delta_sgp < 0.0:
-                c = self._mve_std - delta_sgp
+                c = std - delta_sgp
             else:
-                c = self._mve_std + delta_sgp
+                c = std + delta_sgp
 
             additional_scaling = 1.0
             if c > 1440.0:
-                additional_scaling = (c / 1440.0) * (c / 1440.0)
+                c_scaled = c * (1.0 / 1440.0)
+                additional_scaling = c_scaled * c_scaled
 
+            # sqrt(a) * sqrt(b) == sqrt(a * b) for the non-negative terms here
+            inv_additional_scaling = 1.0 / additional_scaling
             self._mve_std = math.sqrt(
-                additional_scaling
-                * (
-                    self._MEAN_VARIANCE_ESTIMATOR_GAMMA_SCALING
-                    - self._mve_gc_gamma_variance
-                )
-            ) * math.sqrt(
                 (
-                    self._mve_std
-                    * (
-                        self._mve_std
-                        / (
-                            self._MEAN_VARIANCE_ESTIMATOR_GAMMA_SCALING
-                            * additional_scaling
-                        )
-                    )
+                    additional_scaling
+                    * (self._MEAN_VARIANCE_ESTIMATOR_GAMMA_SCALING - gc_gamma_variance)
                 )
-                + (
-                    (
-                        (self._mve_gc_gamma_variance * delta_sgp)
-                        / additional_scaling
-                    )
-                    * delta_sgp
+                * (
+                    (std * std * self._INV_GAMMA_SCALING * inv_additional_scaling)
+                    + (gc_gamma_variance * delta_sgp * inv_additional_scaling * delta_sgp)
                 )
             )
 
             self._mve_mean = self._mve_mean + (
-                (self._mve_gc_gamma_mean * delta_sgp)
-                / self._MEAN_VARIANCE_ESTIMATOR_ADDITIONAL_GAMMA_MEAN_SCALING
+                self._mve_gc_gamma_mean * delta_sgp * self._INV_ADD_GAMMA_MEAN
             )
 
     # ================================================================
@@ -594,21 +617,22 @@ class GasIndexAlgorithm:
         self._mox_sraw_std = sraw_std
         self._mox_sraw_mean = sraw_mean
 
-    # C: GasIndexAlgorithm__mox_model__process
-    def _mox_model_process(self, sraw):
-        if self._algorithm_type == self.ALGORITHM_TYPE_NOX:
-            return (
-                ((sraw - self._mox_sraw_mean) / self._SRAW_STD_NOX)
-                * self._index_gain
-            )
-        else:
-            return (
-                (
-                    (sraw - self._mox_sraw_mean)
-                    / (-1.0 * (self._mox_sraw_std + self._SRAW_STD_BONUS_VOC))
-                )
-                * self._index_gain
+    # C: GasIndexAlgorithm__mox_model__process (NOx branch)
+    def _mox_model_process_nox(self, sraw):
+        return (
+            ((sraw - self._mox_sraw_mean) / self._SRAW_STD_NOX)
+            * self._index_gain
+        )
+
+    # C: GasIndexAlgorithm__mox_model__process (VOC branch)
+    def _mox_model_process_voc(self, sraw):
+        return (
+            (
+                (sraw - self._mox_sraw_mean)
+                / (-1.0 * (self._mox_sraw_std + self._SRAW_STD_BONUS_VOC))
             )
+            * self._index_gain
+        )
 
     # ================================================================
     # Sigmoid Scaled
@@ -619,6 +643,15 @@ class GasIndexAlgorithm:
         self._sigmoid_scaled_k = k
         self._sigmoid_scaled_x0 = x0
         self._sigmoid_scaled_offset_default = offset_default
+        if offset_default == 1.0:
+            shift = (500.0 / 499.0) * (1.0 - self._index_offset)
+        else:
+            shift = (self._SIGMOID_L - (5.0 * self._index_offset)) / 4.0
+        self._sigmoid_scaled_shift = shift
+        self._sigmoid_scaled_l_plus_shift = self._SIGMOID_L + shift
+        self._sigmoid_scaled_negative_gain = (
+            self._index_offset / offset_default
+        ) * self._SIGMOID_L
 
     # C: GasIndexAlgorithm__sigmoid_scaled__process
     def _sigmoid_scaled_process(self, sample):
@@ -627,21 +660,13 @@ class GasIndexAlgorithm:
             return self._SIGMOID_L
         elif x > 50.0:
             return 0.0
+        inv = 1.0 / (1.0 + math.exp(x))
+        if sample >= 0.0:
+            return (
+                self._sigmoid_scaled_l_plus_shift * inv
+            ) - self._sigmoid_scaled_shift
         else:
-            if sample >= 0.0:
-                if self._sigmoid_scaled_offset_default == 1.0:
-                    shift = (500.0 / 499.0) * (1.0 - self._index_offset)
-                else:
-                    shift = (
-                        self._SIGMOID_L - (5.0 * self._index_offset)
-                    ) / 4.0
-                return (
-                    (self._SIGMOID_L + shift) / (1.0 + math.exp(x))
-                ) - shift
-            else:
-                return (
-                    self._index_offset / self._sigmoid_scaled_offset_default
-                ) * (self._SIGMOID_L / (1.0 + math.exp(x)))
+            return self._sigmoid_scaled_negative_gain * inv
 
     # ================================================================
     # Adaptive Lowpass
@@ -655,32 +680,30 @@ class GasIndexAlgorithm:
         self._lp_a2 = self._sampling_interval / (
             self._LP_TAU_SLOW + self._sampling_interval
         )
+        self._lp_one_minus_a1 = 1.0 - self._lp_a1
+        self._lp_one_minus_a2 = 1.0 - self._lp_a2
         self._lp_initialized = False
 
     # C: GasIndexAlgorithm__adaptive_lowpass__process
     def _adaptive_lowpass_process(self, sample):
-        if self._lp_initialized == False:
+        if not self._lp_initialized:
             self._lp_x1 = sample
             self._lp_x2 = sample
             self._lp_x3 = sample
             self._lp_initialized = True
 
-        self._lp_x1 = (
-            ((1.0 - self._lp_a1) * self._lp_x1) + (self._lp_a1 * sample)
-        )
-        self._lp_x2 = (
-            ((1.0 - self._lp_a2) * self._lp_x2) + (self._lp_a2 * sample)
-        )
-
-        abs_delta = self._lp_x1 - self._lp_x2
-        if abs_delta < 0.0:
-            abs_delta = -1.0 * abs_delta
-
-        f1 = math.exp(self._LP_ALPHA * abs_delta)
-        tau_a = (
-            (self._LP_TAU_SLOW - self._LP_TAU_FAST) * f1
-        ) + self._LP_TAU_FAST
-        a3 = self._sampling_interval / (self._sampling_interval + tau_a)
-
-        self._lp_x3 = ((1.0 - a3) * self._lp_x3) + (a3 * sample)
-        return self._lp_x3
+        # locals instead of repeated attribute lookups
+        x1 = (self._lp_one_minus_a1 * self._lp_x1) + (self._lp_a1 * sample)
+        x2 = (self._lp_one_minus_a2 * self._lp_x2) + (self._lp_a2 * sample)
+        self._lp_x1 = x1
+        self._lp_x2 = x2
+
+        tau_fast = self._LP_TAU_FAST
+        f1 = math.exp(self._LP_ALPHA * abs(x1 - x2))
+        tau_a = ((self._LP_TAU_SLOW - tau_fast) * f1) + tau_fast
+        ts = self._sampling_interval
+        a3 = ts / (ts + tau_a)
+
+        x3 = ((1.0 - a3) * self._lp_x3) + (a3 * sample)
+        self._lp_x3 = x3
+        return x3
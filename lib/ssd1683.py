@@ -20,7 +20,7 @@ class SSD1683(FrameBuffer):
     """
 
     def __init__(self, width=400, height=300, cs=45, dc=46, rst=47, busy=48, 
-                 spi_id=1, sck=12, mosi=11):
+                 spi_id=1, sck=12, mosi=11, baudrate=10_000_000):
         """
         Initialize the SSD1683 driver
 
@@ -34,10 +34,16 @@ class SSD1683(FrameBuffer):
             spi_id: SPI bus ID
             sck: SPI clock pin
             mosi: SPI MOSI pin
+            baudrate: SPI clock in Hz (default 10MHz; the SSD1683 write
+                      cycle allows up to 20MHz where the wiring permits)
         """
         self._w = width
         self._h = height
         self._buf = bytearray(width * height // 8)
+        # Writable view of the framebuffer bytes (MONO_HLSB, width // 8 bytes per row)
+        # for bulk writes without intermediate copies; also used for partial updates
+        self.buf = memoryview(self._buf)
+        self._b1 = bytearray(1)  # reused for the command byte of each transaction
         super().__init__(self._buf, width, height, MONO_HLSB)
 
         # GPIO setup
@@ -48,7 +54,7 @@ class SSD1683(FrameBuffer):
 
         # SPI setup
         self._spi = SPI(spi_id,
-                        baudrate=4_000_000,
+                        baudrate=baudrate,
                         sck=Pin(sck),
                         mosi=Pin(mosi),
                         firstbit=SPI.MSB)
@@ -58,26 +64,24 @@ class SSD1683(FrameBuffer):
 
     # ============ Low-level SPI Communication ============
 
-    def _cmd(self, b):
-        """Send a command byte"""
+    def _write_cmd_seq(self, cmd, data=None):
+        """Send a command byte and its data in one CS-low transaction"""
+        self._b1[0] = cmd
         self._cs(0)
         self._dc(0)
-        self._spi.write(bytearray([b]))
+        self._spi.write(self._b1)
+        if data:
+            self._dc(1)
+            self._spi.write(data)
         self._cs(1)
 
-    def _dat(self, b):
-        """Send a data byte"""
+    def _start_data(self, cmd):
+        """Send a command byte and leave CS low with DC high for streamed data"""
+        self._b1[0] = cmd
         self._cs(0)
+        self._dc(0)
+        self._spi.write(self._b1)
         self._dc(1)
-        self._spi.write(bytearray([b]))
-        self._cs(1)
-
-    def _data_bulk(self, data):
-        """Send bulk data (bytes or bytearray)"""
-        self._cs(0)
-        self._dc(1)
-        self._spi.write(data)
-        self._cs(1)
 
     def _wait(self):
         """Wait for the display to be ready (BUSY pin low)"""
@@ -109,16 +113,13 @@ class SSD1683(FrameBuffer):
             x2, y2: End position (bottom-right)
         """
         # X address is in units of 8 pixels
-        self._cmd(0x44)  # SET_RAM_X_ADDRESS_START_END_POSITION
-        self._dat((x1 >> 3) & 0xFF)
-        self._dat((x2 >> 3) & 0xFF)
+        # SET_RAM_X_ADDRESS_START_END_POSITION
+        self._write_cmd_seq(0x44, bytes(((x1 >> 3) & 0xFF, (x2 >> 3) & 0xFF)))
 
         # Y address is in pixels
-        self._cmd(0x45)  # SET_RAM_Y_ADDRESS_START_END_POSITION
-        self._dat(y1 & 0xFF)
-        self._dat((y1 >> 8) & 0xFF)
-        self._dat(y2 & 0xFF)
-        self._dat((y2 >> 8) & 0xFF)
+        # SET_RAM_Y_ADDRESS_START_END_POSITION
+        self._write_cmd_seq(0x45, bytes((y1 & 0xFF, (y1 >> 8) & 0xFF,
+                                         y2 & 0xFF, (y2 >> 8) & 0xFF)))
 
     def _cur(self, x, y):
         """
@@ -128,12 +129,8 @@ class SSD1683(FrameBuffer):
             x: X position (in units of 8 pixels)
             y: Y position (in pixels)
         """
-        self._cmd(0x4E)  # SET_RAM_X_ADDRESS_COUNTER
-        self._dat((x >> 3) & 0xFF)
-
-        self._cmd(0x4F)  # SET_RAM_Y_ADDRESS_COUNTER
-        self._dat(y & 0xFF)
-        self._dat((y >> 8) & 0xFF)
+        self._write_cmd_seq(0x4E, bytes(((x >> 3) & 0xFF,)))  # SET_RAM_X_ADDRESS_COUNTER
+        self._write_cmd_seq(0x4F, bytes((y & 0xFF, (y >> 8) & 0xFF)))  # SET_RAM_Y_ADDRESS_COUNTER
 
     # ============ Update Modes ============
 
@@ -144,9 +141,8 @@ class SSD1683(FrameBuffer):
         - Removes ghosting
         - Use after several partial updates
         """
-        self._cmd(0x22)  # DISPLAY_UPDATE_CONTROL_2
-        self._dat(0xF7)  # Full update sequence
-        self._cmd(0x20)  # MASTER_ACTIVATION
+        self._write_cmd_seq(0x22, b'\xf7')  # DISPLAY_UPDATE_CONTROL_2: Full update sequence
+        self._write_cmd_seq(0x20)  # MASTER_ACTIVATION
         self._wait()
 
     def _update_fast(self):
@@ -156,9 +152,8 @@ class SSD1683(FrameBuffer):
         - May accumulate slight ghosting
         - Good for frequent full-screen changes
         """
-        self._cmd(0x22)  # DISPLAY_UPDATE_CONTROL_2
-        self._dat(0xC7)  # Fast update sequence
-        self._cmd(0x20)  # MASTER_ACTIVATION
+        self._write_cmd_seq(0x22, b'\xc7')  # DISPLAY_UPDATE_CONTROL_2: Fast update sequence
+        self._write_cmd_seq(0x20)  # MASTER_ACTIVATION
         self._wait()
 
     def _update_part(self):
@@ -168,9 +163,8 @@ class SSD1683(FrameBuffer):
         - Updates only changed pixels in window
         - Ghosting accumulates - do full update every 5-10 partials
         """
-        self._cmd(0x22)  # DISPLAY_UPDATE_CONTROL_2
-        self._dat(0xFF)  # Partial update sequence (for SSD1683 4.2")
-        self._cmd(0x20)  # MASTER_ACTIVATION
+        self._write_cmd_seq(0x22, b'\xff')  # DISPLAY_UPDATE_CONTROL_2: Partial update sequence (for SSD1683 4.2")
+        self._write_cmd_seq(0x20)  # MASTER_ACTIVATION
         self._wait()
 
     # ============ Initialization ============
@@ -182,21 +176,17 @@ class SSD1683(FrameBuffer):
         self._reset()
         self._wait()
 
-        self._cmd(0x12)  # SOFT_RESET
+        self._write_cmd_seq(0x12)  # SOFT_RESET
         self._wait()
 
-        # Display update control
-        self._cmd(0x21)  # DISPLAY_UPDATE_CONTROL_1
-        self._dat(0x40)  # Enable clock signal, Enable analog
-        self._dat(0x00)
+        # Display update control: enable clock signal, enable analog
+        self._write_cmd_seq(0x21, b'\x40\x00')  # DISPLAY_UPDATE_CONTROL_1
 
-        # Border waveform
-        self._cmd(0x3C)  # BORDER_WAVEFORM_CONTROL
-        self._dat(0x05)  # Follow LUT
+        # Border waveform: follow LUT
+        self._write_cmd_seq(0x3C, b'\x05')  # BORDER_WAVEFORM_CONTROL
 
         # Data entry mode: X increment, Y increment
-        self._cmd(0x11)  # DATA_ENTRY_MODE_SETTING
-        self._dat(0x03)  # X+, Y+ mode
+        self._write_cmd_seq(0x11, b'\x03')  # DATA_ENTRY_MODE_SETTING
 
         # Set full window
         self._pos(0, 0, self._w - 1, self._h - 1)
@@ -214,31 +204,25 @@ class SSD1683(FrameBuffer):
         self._reset()
         self._wait()
 
-        self._cmd(0x12)  # SOFT_RESET
+        self._write_cmd_seq(0x12)  # SOFT_RESET
         self._wait()
 
         # Display update control
-        self._cmd(0x21)
-        self._dat(0x40)
-        self._dat(0x00)
+        self._write_cmd_seq(0x21, b'\x40\x00')
 
         # Border waveform
-        self._cmd(0x3C)
-        self._dat(0x05)
+        self._write_cmd_seq(0x3C, b'\x05')
 
-        # Write temperature register (speed profile)
-        self._cmd(0x1A)  # WRITE_TEMPERATURE_REGISTER
-        self._dat(0x5A if mode_1s else 0x6E)  # 1s vs 1.5s profile
+        # Write temperature register (speed profile): 1s vs 1.5s profile
+        self._write_cmd_seq(0x1A, b'\x5a' if mode_1s else b'\x6e')  # WRITE_TEMPERATURE_REGISTER
 
         # Load temperature value into LUT
-        self._cmd(0x22)
-        self._dat(0x91)  # Load temperature value
-        self._cmd(0x20)
+        self._write_cmd_seq(0x22, b'\x91')  # Load temperature value
+        self._write_cmd_seq(0x20)
         self._wait()
 
         # Data entry mode
-        self._cmd(0x11)
-        self._dat(0x03)
+        self._write_cmd_seq(0x11, b'\x03')
 
         # Set full window
         self._pos(0, 0, self._w - 1, self._h - 1)
@@ -262,12 +246,10 @@ class SSD1683(FrameBuffer):
         clear_buf = bytes([byte_val] * size)
 
         # Write to NEW data RAM (0x24)
-        self._cmd(0x24)  # WRITE_RAM_BW
-        self._data_bulk(clear_buf)
+        self._write_cmd_seq(0x24, clear_buf)  # WRITE_RAM_BW
 
         # Write to OLD data RAM (0x26) - important for differential updates
-        self._cmd(0x26)  # WRITE_RAM_RED (used as previous frame buffer)
-        self._data_bulk(clear_buf)
+        self._write_cmd_seq(0x26, clear_buf)  # WRITE_RAM_RED (used as previous frame buffer)
 
         # Full update to display
         self._update_full()
@@ -281,8 +263,7 @@ class SSD1683(FrameBuffer):
         Display the current framebuffer content (full screen, full update)
         This is the slowest but cleanest update - removes all ghosting
         """
-        self._cmd(0x24)  # WRITE_RAM_BW
-        self._data_bulk(self._buf)
+        self._write_cmd_seq(0x24, self._buf)  # WRITE_RAM_BW
         self._update_full()
 
     def show_fast(self):
@@ -290,8 +271,7 @@ class SSD1683(FrameBuffer):
         Display the current framebuffer content with fast update
         Faster than show() but may accumulate ghosting over time
         """
-        self._cmd(0x24)  # WRITE_RAM_BW
-        self._data_bulk(self._buf)
+        self._write_cmd_seq(0x24, self._buf)  # WRITE_RAM_BW
         self._update_fast()
 
     def show_partial(self, x, y, w, h):
@@ -319,19 +299,14 @@ class SSD1683(FrameBuffer):
             raise ValueError("Partial window out of display bounds")
 
         # Configure for partial update (from vendor driver)
-        self._cmd(0x3C)  # BORDER_WAVEFORM_CONTROL
-        self._dat(0x80)  # Disable border output during partial
+        self._write_cmd_seq(0x3C, b'\x80')  # BORDER_WAVEFORM_CONTROL: disable border output during partial
 
-        self._cmd(0x21)  # DISPLAY_UPDATE_CONTROL_1
-        self._dat(0x00)
-        self._dat(0x00)
+        self._write_cmd_seq(0x21, b'\x00\x00')  # DISPLAY_UPDATE_CONTROL_1
 
-        self._cmd(0x3C)  # BORDER_WAVEFORM_CONTROL
-        self._dat(0x80)
+        self._write_cmd_seq(0x3C, b'\x80')  # BORDER_WAVEFORM_CONTROL
 
-        # Set data entry mode
-        self._cmd(0x11)  # DATA_ENTRY_MODE_SETTING
-        self._dat(0x03)  # X+, Y+ mode
+        # Set data entry mode: X+, Y+ mode
+        self._write_cmd_seq(0x11, b'\x03')  # DATA_ENTRY_MODE_SETTING
 
         # Set address window and cursor for the region
         self._pos(x, y, x + w - 1, y + h - 1)
@@ -341,15 +316,18 @@ class SSD1683(FrameBuffer):
         bytes_per_row = self._w // 8  # 400 / 8 = 50
         window_bytes_per_row = w // 8
 
-        self._cmd(0x24)  # WRITE_RAM_BW
-        self._cs(0)
-        self._dc(1)
+        self._start_data(0x24)  # WRITE_RAM_BW, rows follow in the same transaction
 
-        for row in range(y, y + h):
-            row_start = row * bytes_per_row
-            window_start = row_start + (x // 8)
-            window_end = window_start + window_bytes_per_row
-            self._spi.write(self._buf[window_start:window_end])
+        mv = self.buf
+        if window_bytes_per_row == bytes_per_row:
+            # Full-width rows are contiguous in the framebuffer
+            self._spi.write(mv[y * bytes_per_row:(y + h) * bytes_per_row])
+        else:
+            for row in range(y, y + h):
+                row_start = row * bytes_per_row
+                window_start = row_start + (x // 8)
+                window_end = window_start + window_bytes_per_row
+                self._spi.write(mv[window_start:window_end])
 
         self._cs(1)
 
@@ -376,10 +354,10 @@ class SSD1683(FrameBuffer):
         w_byte_aligned = ((x + w + 7) // 8) * 8 - x_byte_aligned
 
         # Configure for partial update
-        self._cmd(0x3C); self._dat(0x80)
-        self._cmd(0x21); self._dat(0x00); self._dat(0x00)
-        self._cmd(0x3C); self._dat(0x80)
-        self._cmd(0x11); self._dat(0x03)
+        self._write_cmd_seq(0x3C, b'\x80')
+        self._write_cmd_seq(0x21, b'\x00\x00')
+        self._write_cmd_seq(0x3C, b'\x80')
+        self._write_cmd_seq(0x11, b'\x03')
 
         # Set address window and cursor
         self._pos(x_byte_aligned, y, x_byte_aligned + w_byte_aligned - 1, y + h - 1)
@@ -389,15 +367,17 @@ class SSD1683(FrameBuffer):
         bytes_per_row = self._w // 8
         window_bytes_per_row = w_byte_aligned // 8
 
-        self._cmd(0x24)
-        self._cs(0)
-        self._dc(1)
+        self._start_data(0x24)
 
-        for row in range(y, y + h):
-            row_start = row * bytes_per_row
-            window_start = row_start + (x_byte_aligned // 8)
-            window_end = window_start + window_bytes_per_row
-            self._spi.write(self._buf[window_start:window_end])
+        mv = self.buf
+        if window_bytes_per_row == bytes_per_row:
+            self._spi.write(mv[y * bytes_per_row:(y + h) * bytes_per_row])
+        else:
+            for row in range(y, y + h):
+                row_start = row * bytes_per_row
+                window_start = row_start + (x_byte_aligned // 8)
+                window_end = window_start + window_bytes_per_row
+                self._spi.write(mv[window_start:window_end])
 
         self._cs(1)
         self._update_part()
@@ -409,10 +389,19 @@ class SSD1683(FrameBuffer):
         Put display into deep sleep mode (low power)
         Call init() or init_fast() to wake up
         """
-        self._cmd(0x10)  # DEEP_SLEEP_MODE
-        self._dat(0x01)  # Enter deep sleep
+        self._write_cmd_seq(0x10, b'\x01')  # DEEP_SLEEP_MODE: enter deep sleep
         sleep_ms(100)
 
+    def blit_bytes(self, offset, data):
+        """
+        Copy raw bytes straight into the framebuffer
+
+        Args:
+            offset: Byte offset into the framebuffer (row * width // 8 + x // 8)
+            data: bytes, bytearray or memoryview to copy
+        """
+        self.buf[offset:offset + len(data)] = data
+
     def fill_rect_partial(self, x, y, w, h, color, update=True):
         """
         Fill a rectangle and update only that region